@@ -30,13 +30,15 @@ Strategy
 1. Walk both source folders and build a UUID → file-path index for all
    image files (HEIC, JPG, JPEG, PNG) and video files (MOV) using exiftool
    ContentIdentifier — extracted in BATCH per directory for speed.
-2. Match images to their MOV companions via shared UUID.
-3. For each matched pair:
-   a. Build a rich, sortable name:
+2. Match images to their MOV companions via shared UUID — as the scan
+   streams in, so copying a pair starts while the scan is still running.
+3. For each matched pair build a rich, sortable name:
       YYYY-MM-DD_HHMMSS_LivePhoto_<DeviceModel>_<uuid8>
-   b. Copy-then-verify (SHA-256) image → dest as .heic/.jpg/.jpeg
-   c. Copy-then-verify (SHA-256) video → dest as .mov
-   d. Delete source files only after both copies verified
+   then, across all pairs in three phases:
+   a. Copy image → dest as .heic/.jpg/.jpeg and video → dest as .mov
+      (a copy-on-write clone where the filesystem supports it)
+   b. Verify every copy (BLAKE2b, or SHA-256 with --hash sha256)
+   c. Delete each source file only after its copy verified
 4. Unmatched images tagged as Live Photos are logged as orphan images.
 5. Unmatched MOVs with a ContentIdentifier are logged as orphan videos.
 6. A JSON manifest is written to dest/live_photo_manifest.json for audit.
@@ -46,7 +48,9 @@ Live Photo Detection
 - Image is a Live Photo: MakerNotes:LivePhotoVideoIndex present AND
   ContentIdentifier UUID present.
 - Companion MOV: ContentIdentifier UUID matches the image.
-- Key: use exiftool WITHOUT -fast2 (that flag skips ContentIdentifier).
+- Key: use exiftool -fast but NOT -fast2 (that flag skips MakerNotes and
+  stops at the MOV mdat atom, losing ContentIdentifier). Plain -fast only
+  skips JPEG trailer scanning.
 
 Apple Photos Re-import
 ----------------------
@@ -58,17 +62,27 @@ ContentIdentifier metadata must survive the copy. This script does both.
 from __future__ import annotations
 
 import os
+import re
 import sys
 import json
+import ctypes
+import fcntl
+import mmap
 import shutil
 import signal
 import hashlib
+import contextlib
+import select
 import logging
 import argparse
 import subprocess
+import time
+import queue
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
 # ──────────────────────────────────────────────
 # Configuration
@@ -88,11 +102,40 @@ IMAGE_EXTS = {".heic", ".jpg", ".jpeg", ".png"}
 # Video extensions that can be Live Photo companions
 VIDEO_EXTS = {".mov"}
 
-# All media extensions we care about
+# All media extensions we care about (lowercase — matched against name.lower())
 ALL_EXTS = IMAGE_EXTS | VIDEO_EXTS
 
-# How many files to batch per exiftool call (balance memory vs process overhead)
-EXIFTOOL_BATCH_SIZE = 500
+# --strict-names: only camera-roll names can be Live Photos (IMG_1234.HEIC / .MOV).
+# Screenshots (PNG) and renamed/exported JPEGs never reach exiftool.
+STRICT_LP_NAME_RE = re.compile(r"^IMG_\d+\.(heic|mov|jpg|jpeg)$", re.IGNORECASE)
+
+# Files per exiftool call. This is the starting size: scan_folder halves or
+# doubles it within [MIN, MAX] based on measured time per file.
+EXIFTOOL_BATCH_SIZE = 128
+EXIFTOOL_MIN_BATCH = 16
+EXIFTOOL_MAX_BATCH = 1000
+
+# Parallel exiftool processes during the scan (one stay_open process per worker)
+EXIFTOOL_WORKERS = os.cpu_count() or 4
+
+# Digest used to verify copies. BLAKE2b (stdlib) hashes several times faster than
+# SHA-256 on CPUs without SHA extensions, so the copy stays disk-bound.
+# Override with --hash sha256.
+HASH_ALGO = "blake2b"
+HASH_CHOICES = ("blake2b", "sha256")
+
+# Read/write block size for the hash-while-copying loop in do_copy
+COPY_CHUNK_SIZE = 4 << 20  # 4 MiB
+
+# Files copied / verified concurrently (I/O bound — copy and hashing release the GIL)
+MOVE_WORKERS = 4
+
+# Log copy/verify progress every N files
+PROGRESS_EVERY = 100
+
+# Per-file exiftool results from earlier runs, kept in the dest folder
+SCAN_CACHE_NAME = ".lp_scan_cache.json"
+SCAN_CACHE_VERSION = 2
 
 LOG_DIR = Path(__file__).parent / "logs"
 PID_FILE = LOG_DIR / "live_photo_sort.pid"
@@ -135,118 +178,428 @@ signal.signal(signal.SIGINT, _handle_signal)
 # Batch exiftool scanning (core performance win)
 # ──────────────────────────────────────────────
 
-TAGS = [
-    "SourceFile",
-    "ContentIdentifier",
-    "LivePhotoVideoIndex",
-    "DateTimeOriginal",
-    "GPSLatitude",
-    "GPSLongitude",
-    "Make",
-    "Model",
-    "Description",
-    "FileTypeExtension",
-    "MIMEType",
-]
+class ExifRec(NamedTuple):
+    """
+    One exiftool JSON record. Fields are the tags requested from exiftool —
+    only the ones matching and naming actually read, since each extra tag
+    makes exiftool parse more of every file.
+    """
+    SourceFile: str = ""
+    ContentIdentifier: Optional[str] = None
+    LivePhotoVideoIndex: Optional[int] = None
+    DateTimeOriginal: str = ""
+    Model: str = ""
+
+
+TAGS = list(ExifRec._fields)
+
+
+def _exif_rec(obj: dict) -> ExifRec:
+    """Build an ExifRec from one decoded exiftool JSON record."""
+    return ExifRec(
+        str(obj.get("SourceFile", "")),
+        obj.get("ContentIdentifier"),
+        obj.get("LivePhotoVideoIndex"),
+        str(obj.get("DateTimeOriginal", "")),
+        str(obj.get("Model", "")),
+    )
+
 
+class ExifTool:
+    """
+    A single long-lived ``exiftool -stay_open True -@ -`` process.
+
+    Each batch is written to stdin as one argument per line, terminated by
+    ``-execute<N>``. exiftool prints ``{ready<N>}`` on stdout when the batch is
+    done (and on stderr too, via ``-echo4``), so both pipes can be read up to
+    that sentinel. Perl startup and tag-table loading are paid once per run
+    instead of once per batch.
+    """
+
+    def __init__(self):
+        self._seq = 0
+        self._proc = self._spawn()
+
+    @staticmethod
+    def _spawn() -> subprocess.Popen:
+        return subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> "ExifTool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def execute(self, args: list[str], timeout: float = 300) -> tuple[bytearray, bytearray]:
+        """Run one batch of arguments and return raw (stdout, stderr) without sentinels."""
+        self._seq += 1
+        sentinel = f"{{ready{self._seq}}}\n".encode()
+        # os.fsencode, like argv: paths os.scandir decoded with surrogate
+        # escapes (non-UTF-8 names) go back out as their original bytes
+        args = args + ["-echo4", f"{{ready{self._seq}}}", f"-execute{self._seq}"]
+        self._proc.stdin.write(b"\n".join(map(os.fsencode, args)) + b"\n")
+        self._proc.stdin.flush()
+        deadline = time.monotonic() + timeout
+        return self._read_both(sentinel, deadline)
+
+    def _read_both(self, sentinel: bytes, deadline: float) -> tuple[bytearray, bytearray]:
+        """
+        Drain stdout and stderr together until each ends with the sentinel.
+        Reading one pipe to the end first would deadlock once the other
+        fills its ~64 KB buffer (e.g. hundreds of per-file error lines).
+        """
+        bufs = {self._proc.stdout.fileno(): bytearray(),
+                self._proc.stderr.fileno(): bytearray()}
+        pending = list(bufs)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self._proc.args, 0)
+            ready, _, _ = select.select(pending, [], [], remaining)
+            for fd in ready:
+                chunk = os.read(fd, 1 << 16)
+                if not chunk:
+                    raise RuntimeError("exiftool exited unexpectedly")
+                buf = bufs[fd]
+                buf += chunk
+                if buf.endswith(sentinel):
+                    del buf[-len(sentinel):]  # trim in place — no copy of a multi-MB buffer
+                    pending.remove(fd)
+        out_fd, err_fd = self._proc.stdout.fileno(), self._proc.stderr.fileno()
+        return bufs[out_fd], bufs[err_fd]
+
+    def close(self) -> None:
+        """Ask exiftool to exit; kill it if it does not go quietly."""
+        if self._proc.poll() is not None:
+            return
+        try:
+            self._proc.stdin.write(b"-stay_open\nFalse\n")
+            self._proc.stdin.flush()
+            self._proc.wait(timeout=10)
+        except Exception:
+            self._proc.kill()
+            self._proc.wait()
+
+    def restart(self) -> None:
+        """Kill and respawn — a timed-out batch leaves the pipes out of sync."""
+        self._proc.kill()
+        self._proc.wait()
+        self._proc = self._spawn()
 
-def batch_exiftool(file_paths: list[str]) -> list[dict]:
+
+class LPEntry(NamedTuple):
+    """
+    What the rest of the run needs from one Live Photo file's metadata.
+    A plain tuple of strings instead of (Path, full exiftool record) keeps
+    the UUID index small on archives with 100k+ pairs.
+    """
+    path: str
+    date: str   # DateTimeOriginal as "YYYY:MM:DD HH:MM:SS", or ""
+    model: str  # Camera model, or ""
+
+
+def _argfile_problem(path: str) -> Optional[str]:
+    """
+    Why path can't be one line of the -@ stream, or None if it can.
+    A newline would split it into two arguments, and a lone surrogate that
+    did not come from os.scandir has no bytes for os.fsencode to emit.
+    """
+    if "\n" in path:
+        return "a newline in its path"
+    try:
+        os.fsencode(path)
+    except UnicodeEncodeError:
+        return "an unencodable path"
+    return None
+
+
+def batch_exiftool(exiftool: ExifTool, file_paths: list[str]) -> list[dict]:
     """
     Run exiftool on a batch of files and return a list of metadata dicts.
-    Uses JSON output for reliable parsing. One exiftool subprocess per batch.
+    Uses JSON output for reliable parsing. The batch is fed to the shared
+    stay_open exiftool process instead of spawning a new one.
+
+    Arguments go over stdin one per line (exiftool's -@ argfile format), so
+    batch size is not bounded by ARG_MAX. A path that can't be sent that way
+    (see _argfile_problem) is skipped on its own instead of failing the
+    whole batch.
     """
+    safe = []
+    for p in file_paths:
+        problem = _argfile_problem(p)
+        if problem:
+            log.warning("Skipping file with %s: %r", problem, p)
+        else:
+            safe.append(p)
+    file_paths = safe
     if not file_paths:
         return []
-    cmd = ["exiftool", "-json", "-n"] + [f"-{t}" for t in TAGS] + file_paths
+    args = ["-json", "-n", "-fast"] + [f"-{t}" for t in TAGS] + file_paths
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 min per batch of 500 files
-        )
-        if result.returncode not in (0, 1):  # 1 = some warnings but still ok
-            log.warning("exiftool returned %d: %s", result.returncode, result.stderr[:200])
-        if not result.stdout.strip():
+        out, err = exiftool.execute(args, timeout=300)  # 5 min per batch
+        if err.strip():
+            log.warning("exiftool: %s", err.decode("utf-8", "replace")[:200])
+        if not out or out.isspace():
             return []
-        return json.loads(result.stdout)
+        # json.loads takes the raw UTF-8 bytes directly — no intermediate str
+        return json.loads(out)
     except json.JSONDecodeError as exc:
         log.error("exiftool JSON parse error: %s", exc)
         return []
     except subprocess.TimeoutExpired:
         log.error("exiftool timed out on batch of %d files", len(file_paths))
+        exiftool.restart()
         return []
     except Exception as exc:
         log.error("exiftool batch error: %s", exc)
+        exiftool.restart()
         return []
 
 
-def collect_candidate_files(folder: str) -> list[Path]:
-    """Walk folder and return all files with relevant extensions."""
-    folder_path = Path(folder)
-    if not folder_path.exists():
+def collect_candidate_files(folder: str, strict_names: bool = False) -> list[str]:
+    """
+    Walk folder and return the paths of all files with relevant extensions.
+    With strict_names, only files matching STRICT_LP_NAME_RE are returned.
+    Uses os.scandir so file/dir checks come from the cached dirent type
+    instead of a stat() per entry, and no Path is built for skipped files.
+    """
+    if not os.path.isdir(folder):
         log.warning("Source folder does not exist: %s", folder)
         return []
+    # Absolute paths can't be mistaken for exiftool options ("-…") or argfile
+    # comments ("#…") when sent over the -@ stream.
+    folder = os.path.abspath(folder)
     candidates = []
-    for fpath in folder_path.rglob("*"):
-        if fpath.is_file() and fpath.suffix.lower() in ALL_EXTS:
-            candidates.append(fpath)
+    stack = [folder]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        name = entry.name
+                        if strict_names:
+                            if STRICT_LP_NAME_RE.match(name):
+                                candidates.append(entry.path)
+                            continue
+                        dot = name.rfind(".")
+                        if dot >= 0 and name[dot:].lower() in ALL_EXTS:
+                            candidates.append(entry.path)
+        except OSError as exc:
+            log.warning("Cannot read directory %s: %s", d, exc)
     return candidates
 
 
-def scan_folder(folder: str) -> tuple[dict, dict]:
+class ScanCache:
+    """
+    Exiftool records from earlier runs, keyed by path and valid while the
+    file's (mtime_ns, size) is unchanged. Persisted as JSON in the dest
+    folder so repeat runs skip exiftool for files that have not changed.
+    Only entries looked up or stored during this run are written back.
+    Each entry is a flat list keyed by path: [mtime_ns, size, *ExifRec[1:]].
+    """
+
+    def __init__(self, path: Path, load: bool = True):
+        self.path = path
+        self._old: dict = {}
+        self._new: dict = {}
+        self._stats: dict = {}
+        if not load:
+            return
+        try:
+            with open(path, "rb") as f:
+                data = json.load(f)
+            if data.get("version") == SCAN_CACHE_VERSION:
+                self._old = data.get("files", {})
+            log.info("Scan cache: %d entries loaded from %s", len(self._old), path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as exc:
+            log.warning("Ignoring unreadable scan cache %s: %s", path, exc)
+
+    def get(self, file_path: str) -> Optional[dict]:
+        """Return the cached record if the file is unchanged, else None."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = [st.st_mtime_ns, st.st_size]
+        cached = self._old.get(file_path)
+        if cached is not None and cached[:2] == key:
+            self._new[file_path] = cached
+            return dict(zip(TAGS, [file_path] + cached[2:]))
+        self._stats[file_path] = key
+        return None
+
+    def put(self, rec: dict) -> None:
+        """Remember a fresh exiftool record, keyed by the stat taken in get()."""
+        key = self._stats.pop(rec.get("SourceFile"), None)
+        if key is not None:
+            exif = _exif_rec(rec)
+            self._new[exif.SourceFile] = key + list(exif[1:])
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(json.dumps({"version": SCAN_CACHE_VERSION, "files": self._new}).encode())
+        os.replace(tmp, self.path)
+        log.info("Scan cache: %d entries written to %s", len(self._new), self.path)
+
+
+def _index_record(rec: dict, images: dict, videos: dict,
+                  on_entry: Optional[Callable] = None) -> None:
+    """
+    File one exiftool record under its UUID (first-seen wins).
+    on_entry(kind, uuid, entry) is called for each newly indexed file.
+    """
+    uuid = rec.get("ContentIdentifier")
+    if not uuid:
+        return  # No UUID = not a Live Photo
+    src_file = rec.get("SourceFile")
+    if not src_file:
+        return
+    ext = os.path.splitext(src_file)[1].lower()
+    # Image and video share one string object per UUID, so matching lookups
+    # hit the identity fast path and duplicates are not kept in memory.
+    uuid = sys.intern(str(uuid))
+
+    if ext in IMAGE_EXTS and rec.get("LivePhotoVideoIndex") is not None:
+        # It's a Live Photo image
+        if uuid not in images:
+            images[uuid] = LPEntry(src_file, str(rec.get("DateTimeOriginal", "")),
+                                   str(rec.get("Model", "")))
+            if on_entry is not None:
+                on_entry("image", uuid, images[uuid])
+
+    elif ext in VIDEO_EXTS:
+        # It's a potential Live Photo companion MOV
+        if uuid not in videos:
+            videos[uuid] = LPEntry(src_file, str(rec.get("DateTimeOriginal", "")),
+                                   str(rec.get("Model", "")))
+            if on_entry is not None:
+                on_entry("video", uuid, videos[uuid])
+
+
+def scan_folder(folder: str, strict_names: bool = False,
+                cache: Optional[ScanCache] = None,
+                on_entry: Optional[Callable] = None) -> tuple[dict, dict]:
     """
     Walk folder and return:
-      images: {uuid: (path, meta_dict)}
-      videos: {uuid: (path, meta_dict)}
+      images: {uuid: LPEntry}
+      videos: {uuid: LPEntry}
 
-    Uses batch exiftool for speed.
+    Uses batch exiftool for speed; files unchanged since the last run are
+    served from `cache` without running exiftool. on_entry(kind, uuid, entry)
+    streams each new entry out as soon as it is known (see _index_record).
     """
     images: dict = {}
     videos: dict = {}
 
-    candidates = collect_candidate_files(folder)
+    candidates = collect_candidate_files(folder, strict_names)
     if not candidates:
         log.info("No candidate files found in %s", folder)
         return images, videos
 
     log.info("Scanning %s — %d candidate files…", folder, len(candidates))
 
-    # Process in batches
-    for batch_start in range(0, len(candidates), EXIFTOOL_BATCH_SIZE):
+    if cache is not None:
+        to_scan = []
+        for path in candidates:
+            rec = cache.get(path)
+            if rec is None:
+                to_scan.append(path)
+            else:
+                _index_record(rec, images, videos, on_entry)
+        log.info("  %d unchanged files from scan cache, %d to scan with exiftool",
+                 len(candidates) - len(to_scan), len(to_scan))
+        candidates = to_scan
+
+    workers = min(EXIFTOOL_WORKERS, -(-len(candidates) // EXIFTOOL_BATCH_SIZE))
+
+    # One persistent exiftool process per worker thread. The parsing work runs
+    # inside exiftool, so threads waiting on pipes keep every core busy.
+    idle: queue.Queue = queue.Queue()
+    try:
+        for _ in range(workers):
+            idle.put(ExifTool())
+    except OSError as exc:
+        log.error("Could not start exiftool: %s", exc)
+
+    def run_batch(batch: list[str]) -> tuple[list[dict], float]:
         if not _running:
-            log.warning("Scan interrupted during batching.")
-            break
-
-        batch = candidates[batch_start: batch_start + EXIFTOOL_BATCH_SIZE]
-        batch_strs = [str(p) for p in batch]
-        batch_num = batch_start // EXIFTOOL_BATCH_SIZE + 1
-        total_batches = (len(candidates) + EXIFTOOL_BATCH_SIZE - 1) // EXIFTOOL_BATCH_SIZE
-        log.info("  Batch %d/%d (%d files)…", batch_num, total_batches, len(batch))
-
-        records = batch_exiftool(batch_strs)
-
-        for rec in records:
-            src_file = rec.get("SourceFile", "")
-            if not src_file:
-                continue
-            fpath = Path(src_file)
-            ext = fpath.suffix.lower()
-            uuid = rec.get("ContentIdentifier")
-            lp_index = rec.get("LivePhotoVideoIndex")
-
-            if not uuid:
-                continue  # No UUID = not a Live Photo
-
-            if ext in IMAGE_EXTS and lp_index is not None:
-                # It's a Live Photo image
-                if uuid not in images:
-                    images[uuid] = (fpath, rec)
-
-            elif ext in VIDEO_EXTS:
-                # It's a potential Live Photo companion MOV
-                if uuid not in videos:
-                    videos[uuid] = (fpath, rec)
+            return [], 0.0
+        exiftool = idle.get()
+        try:
+            t0 = time.monotonic()
+            records = batch_exiftool(exiftool, batch)
+            return records, (time.monotonic() - t0) * 1000
+        finally:
+            idle.put(exiftool)
+
+    # Batch size adapts to measured exiftool time per file: a batch more than
+    # twice as slow per file as the running average halves the next size
+    # (so one pathological file stalls fewer others), one under half doubles it.
+    size = EXIFTOOL_BATCH_SIZE
+    avg_ms: Optional[float] = None
+    pos = 0
+    done_files = 0
+    pending: collections.deque = collections.deque()
+
+    # Read once: running batches take processes off `idle`, so its size
+    # would shrink the in-flight cap below the worker count mid-loop.
+    n_workers = idle.qsize()
+    if n_workers:
+        try:
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                def submit() -> None:
+                    nonlocal pos
+                    batch = candidates[pos: pos + size]
+                    pos += len(batch)
+                    pending.append((len(batch), pool.submit(run_batch, batch)))
+
+                while pos < len(candidates) and len(pending) < 2 * n_workers:
+                    submit()
+                # Results are consumed in submission order so first-seen UUID still wins
+                batch_num = 0
+                while pending:
+                    n, fut = pending.popleft()
+                    records, ms = fut.result()
+                    if not _running:
+                        log.warning("Scan interrupted during batching.")
+                        break
+                    batch_num += 1
+                    done_files += n
+                    log.info("  Batch %d (%d files, %d/%d done, %.0f ms/file)…",
+                             batch_num, n, done_files, len(candidates), ms / n)
+
+                    per_file = ms / n
+                    if avg_ms is None:
+                        avg_ms = per_file
+                    else:
+                        if per_file > 2 * avg_ms:
+                            size = max(size // 2, EXIFTOOL_MIN_BATCH)
+                        elif per_file < 0.5 * avg_ms:
+                            size = min(size * 2, EXIFTOOL_MAX_BATCH)
+                        avg_ms = 0.8 * avg_ms + 0.2 * per_file
+
+                    for rec in records:
+                        if cache is not None:
+                            cache.put(rec)
+                        _index_record(rec, images, videos, on_entry)
+
+                    if pos < len(candidates):
+                        submit()
+        finally:
+            while not idle.empty():
+                idle.get().close()
 
     log.info("Scan complete in %s: %d LP images, %d LP companion videos found.",
              folder, len(images), len(videos))
@@ -257,7 +610,20 @@ def scan_folder(folder: str) -> tuple[dict, dict]:
 # File naming
 # ──────────────────────────────────────────────
 
-def rich_base_name(meta: dict, uuid: str) -> str:
+def _fast_exif_date(s: str) -> str:
+    """
+    "YYYY:MM:DD HH:MM:SS" → "YYYY-MM-DD_HHMMSS" by slicing. exiftool always
+    emits this fixed layout, so strptime's format parsing is skipped.
+    Anything that doesn't fit gives the placeholder date.
+    """
+    if len(s) >= 19 and s[4] == s[7] == ":" and s[13] == s[16] == ":":
+        digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+        if digits.isascii() and digits.isdigit():
+            return f"{s[0:4]}-{s[5:7]}-{s[8:10]}_{s[11:13]}{s[14:16]}{s[17:19]}"
+    return "0000-00-00_000000"
+
+
+def rich_base_name(entry: LPEntry, uuid: str) -> str:
     """
     Build a rich, sortable base filename (no extension).
     Format: YYYY-MM-DD_HHMMSS_LivePhoto_<DeviceModel>_<uuid8>
@@ -266,31 +632,33 @@ def rich_base_name(meta: dict, uuid: str) -> str:
     can re-link them as a pair on import.
     """
     # Date — exiftool returns "YYYY:MM:DD HH:MM:SS" with -n
-    dt_raw = meta.get("DateTimeOriginal", "")
-    try:
-        dt = datetime.strptime(dt_raw, "%Y:%m:%d %H:%M:%S")
-        date_str = dt.strftime("%Y-%m-%d_%H%M%S")
-    except (ValueError, TypeError):
-        date_str = "0000-00-00_000000"
+    date_str = _fast_exif_date(entry.date)
 
     # Short UUID — first 8 hex chars (no dashes), uppercase
     uuid_short = (uuid.replace("-", "")[:8]).upper()
 
     # Device model (compact, no spaces)
-    model = str(meta.get("Model", "")).replace(" ", "").replace(",", "")
+    model = entry.model.replace(" ", "").replace(",", "")
     if not model:
         model = "iPhone"
 
     return f"{date_str}_LivePhoto_{model}_{uuid_short}"
 
 
-def safe_dest_path(dest_dir: Path, base: str, ext: str) -> Path:
-    """Return a path that doesn't collide in dest_dir."""
-    candidate = dest_dir / f"{base}{ext}"
+def safe_dest_path(dest_dir: Path, base: str, ext: str,
+                   reserved: Optional[set] = None) -> str:
+    """
+    Return a path that doesn't collide in dest_dir.
+    Paths in `reserved` (handed out but not yet written) also count as taken;
+    the chosen path is added to it.
+    """
+    taken = reserved if reserved is not None else set()
+    candidate = os.path.join(dest_dir, f"{base}{ext}")
     counter = 1
-    while candidate.exists():
-        candidate = dest_dir / f"{base}_{counter:02d}{ext}"
+    while candidate in taken or os.path.exists(candidate):
+        candidate = os.path.join(dest_dir, f"{base}_{counter:02d}{ext}")
         counter += 1
+    taken.add(candidate)
     return candidate
 
 
@@ -298,33 +666,158 @@ def safe_dest_path(dest_dir: Path, base: str, ext: str) -> Path:
 # File integrity
 # ──────────────────────────────────────────────
 
-def sha256_file(path: str) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1 << 20), b""):
-            h.update(chunk)
+# Media files are read once, sequentially, and never again. Keeping them out
+# of the page cache leaves it to the directory metadata and exiftool's reads
+# instead of evicting them on archives larger than RAM.
+
+def _bypass_page_cache(fd: int) -> None:
+    """
+    macOS: F_NOCACHE — read()/write() on fd skip the unified buffer cache.
+    It does not apply to pages faulted in through an mmap of fd.
+    """
+    if hasattr(fcntl, "F_NOCACHE"):
+        fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+
+
+def _evict_page_cache(fd: int) -> None:
+    """Linux: drop fd's clean cached pages once we are done reading them."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def hash_file(path: str) -> str:
+    """
+    Digest a file without filling the page cache. On macOS, F_NOCACHE only
+    covers read(), so hash with a readinto() loop over one reused buffer;
+    elsewhere use a read-only memory map (one C-level update) and evict the
+    pages afterwards.
+    """
+    h = hashlib.new(HASH_ALGO)
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        if hasattr(fcntl, "F_NOCACHE"):
+            _bypass_page_cache(fd)
+            buf = bytearray(COPY_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
+            return h.hexdigest()
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return h.hexdigest()  # mmap can't map an empty file
+        if hasattr(os, "posix_fadvise"):  # Linux only — hint sequential readahead
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            h.update(mm)
+        _evict_page_cache(fd)
     return h.hexdigest()
 
 
-def safe_move(src: Path, dst: Path) -> bool:
+def _load_clonefile():
+    """Bind clonefile(2) from libSystem on macOS; None elsewhere."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        fn = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_clonefile = _load_clonefile()
+
+# Linux <linux/fs.h>: _IOW(0x94, 9, int) — reflink one whole file onto another
+FICLONE = 0x40049409
+
+
+def _remove_quietly(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def clone_file(src: str, dst: str) -> bool:
     """
-    Copy src → dst, verify SHA-256 match, then remove src.
-    Returns True on success.
+    Clone src → dst as a copy-on-write reflink, if the filesystem can.
+      macOS: clonefile(2) — an O(1) clone on APFS.
+      Linux: the FICLONE ioctl — an O(1) reflink on Btrfs/XFS.
+    Only true clones count: an in-kernel data copy (copy_file_range on ext4)
+    would cost a second read of src at verify time, so do_copy's
+    hash-while-copying stream is used instead.
+    Returns False (leaving no dst behind) when unsupported, e.g. across volumes.
     """
+    if _clonefile is not None:
+        return _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    if not sys.platform.startswith("linux"):
+        return False
     try:
-        shutil.copy2(str(src), str(dst))
-        src_hash = sha256_file(str(src))
-        dst_hash = sha256_file(str(dst))
-        if src_hash == dst_hash:
-            src.unlink()
-            return True
-        else:
-            log.error("SHA-256 mismatch after copy: %s → %s (src=%s dst=%s)",
-                      src, dst, src_hash[:12], dst_hash[:12])
-            dst.unlink(missing_ok=True)
-            return False
+        with open(src, "rb") as fi, open(dst, "wb") as fo:
+            fcntl.ioctl(fo.fileno(), FICLONE, fi.fileno())
+        return True
+    except OSError:
+        pass
+    _remove_quietly(dst)
+    return False
+
+
+def do_copy(src: str, dst: str) -> tuple[bool, Optional[str]]:
+    """
+    Copy src → dst, as a clone when the filesystem supports it (see clone_file);
+    otherwise the source is hashed while it is being streamed, so it is read once.
+    Returns (ok, src_digest). The digest is None for clones — verify_copy
+    hashes the source then.
+    """
+    try:
+        src_hash = None
+        if not clone_file(src, dst):
+            h = hashlib.new(HASH_ALGO)
+            with open(src, "rb") as fi, open(dst, "wb") as fo:
+                _bypass_page_cache(fi.fileno())
+                _bypass_page_cache(fo.fileno())
+                while chunk := fi.read(COPY_CHUNK_SIZE):
+                    h.update(chunk)
+                    fo.write(chunk)
+                _evict_page_cache(fi.fileno())
+            src_hash = h.hexdigest()
+        shutil.copystat(src, dst)  # what copy2 adds over a plain copy
+        return True, src_hash
+    except Exception as exc:
+        log.error("Copy failed %s → %s: %s", src, dst, exc)
+        _remove_quietly(dst)
+        return False, None
+
+
+def verify_copy(src: str, dst: str, src_hash: Optional[str] = None) -> bool:
+    """
+    Read dst back and compare its HASH_ALGO digest with src's.
+    A copy that fails verification is removed. Returns True on match.
+    """
+    try:
+        if src_hash is None:
+            src_hash = hash_file(src)
+        dst_hash = hash_file(dst)
     except Exception as exc:
-        log.error("safe_move failed %s → %s: %s", src, dst, exc)
+        log.error("Verify failed %s → %s: %s", src, dst, exc)
+        _remove_quietly(dst)
+        return False
+    if src_hash == dst_hash:
+        return True
+    log.error("%s mismatch after copy: %s → %s (src=%s dst=%s)",
+              HASH_ALGO, src, dst, src_hash[:12], dst_hash[:12])
+    _remove_quietly(dst)
+    return False
+
+
+def finalize_move(src: str, dst: str, verified: bool) -> bool:
+    """Remove src once its copy at dst is verified. Returns True if the move is complete."""
+    if not verified:
+        return False
+    try:
+        os.unlink(src)
+        return True
+    except OSError as exc:
+        log.error("Could not remove source %s (copy kept at %s): %s", src, dst, exc)
         return False
 
 
@@ -332,10 +825,149 @@ def safe_move(src: Path, dst: Path) -> bool:
 # Move pairs
 # ──────────────────────────────────────────────
 
+class PairMover:
+    """
+    Moves matched pairs into dest_dir in three phases: copy every file,
+    verify every copy, then remove the sources whose copies verified.
+    Copies run on a thread pool and can start as soon as a pair is matched —
+    main() starts them while the scan is still running, so copy I/O overlaps
+    exiftool time. Verification waits for finish().
+
+    No source is removed until every copy exists, so unless the copies are
+    clones, dest needs free space for the whole set of pairs, not one pair.
+    """
+
+    def __init__(self, dest_dir: Path):
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        self.dest_dir = dest_dir
+        self.pairs: dict = {}  # uuid → per-pair state
+        self._reserved: set = set()
+        self._copies: list = []
+        self._pool = ThreadPoolExecutor(max_workers=MOVE_WORKERS)
+
+    def start(self, uuid: str, img: LPEntry, vid: LPEntry) -> None:
+        """
+        Reserve destination names for a matched pair and queue its copies.
+        Called from one thread only, so concurrent copies never race for
+        the same free name.
+        """
+        if uuid in self.pairs:
+            return
+        base = rich_base_name(img, uuid)
+        img_ext = os.path.splitext(img.path)[1].lower()
+        self.pairs[uuid] = st = {
+            "base": base,
+            "started": False,
+            "image": {"src": img.path, "copied": False, "hash": None,
+                      "dst": safe_dest_path(self.dest_dir, base, img_ext, self._reserved),
+                      "verified": False, "moved": False},
+            "video": {"src": vid.path, "copied": False, "hash": None,
+                      "dst": safe_dest_path(self.dest_dir, base, ".mov", self._reserved),
+                      "verified": False, "moved": False},
+        }
+        self._copies.append(self._pool.submit(self._copy_pair, st))
+
+    @staticmethod
+    def _copy_pair(st: dict) -> int:
+        """
+        Copy both halves of a pair. The stop check is made once per pair, so a
+        signal can never land between the image and video copies.
+        Returns the number of files copied.
+        """
+        if not _running:  # once stopping, start no new pairs
+            return 0
+        st["started"] = True
+        img, vid = st["image"], st["video"]
+        img["copied"], img["hash"] = do_copy(img["src"], img["dst"])
+        if img["copied"]:  # no point copying the video of a pair that can't move
+            vid["copied"], vid["hash"] = do_copy(vid["src"], vid["dst"])
+        return img["copied"] + vid["copied"]
+
+    @staticmethod
+    def _verify_one(f: dict) -> bool:
+        f["verified"] = verify_copy(f["src"], f["dst"], f["hash"])
+        return f["verified"]
+
+    def finish(self, manifest: dict) -> tuple[int, int]:
+        """
+        Wait for all copies, verify them, remove verified sources and append
+        one manifest entry per started pair. Returns (succeeded, failed) pairs.
+        """
+        files = [st[side] for st in self.pairs.values() for side in ("image", "video")]
+        counts = {"copied": 0, "verified": 0, "finalized": 0}
+
+        def progress(done: int) -> None:
+            if done % PROGRESS_EVERY == 0 or done == len(files):
+                log.info("  Progress: %d copied, %d verified, %d finalized (of %d files)",
+                         counts["copied"], counts["verified"], counts["finalized"], len(files))
+
+        with self._pool:
+            # Phase 1: copy (clone where possible) — many may already be done
+            log.info("Copying %d files (%d pairs)…", len(files), len(self.pairs))
+            for done, fut in enumerate(as_completed(self._copies), 1):
+                counts["copied"] += fut.result()
+                progress(2 * done)
+            if not _running:
+                log.warning("Copy interrupted — verifying and finalizing the %d files already copied.",
+                            counts["copied"])
+
+            # Phase 2: verify every copy. Runs even after a stop signal so that
+            # finished copies are not left behind as unverified duplicates.
+            copied = [f for f in files if f["copied"]]
+            verifies = [self._pool.submit(self._verify_one, f) for f in copied]
+            for done, fut in enumerate(as_completed(verifies), 1):
+                counts["verified"] += fut.result()
+                progress(done)
+
+        # Phase 3: remove sources — only when BOTH halves verified, so a pair is
+        # never split between source and dest (Photos needs them together)
+        success_count = 0
+        fail_count = 0
+        for i, uuid in enumerate(sorted(self.pairs), 1):
+            st = self.pairs[uuid]
+            img, vid = st["image"], st["video"]
+            if not st["started"]:
+                continue  # Never started (stop signal)
+            both_ok = img["verified"] and vid["verified"]
+            if not both_ok:
+                # Keep both sources; drop the lone verified copy so the pair
+                # is retried whole on the next run
+                for f in (img, vid):
+                    if f["verified"]:
+                        log.warning("  Removing copy %s — its pair half failed", f["dst"])
+                        _remove_quietly(f["dst"])
+            for f in (img, vid):
+                f["moved"] = finalize_move(f["src"], f["dst"], both_ok)
+                counts["finalized"] += f["moved"]
+
+            manifest["pairs"].append({
+                "uuid": uuid,
+                "base_name": st["base"],
+                "image": {"source": img["src"], "dest": img["dst"], "success": img["moved"]},
+                "video": {"source": vid["src"], "dest": vid["dst"], "success": vid["moved"]},
+            })
+
+            if img["moved"] and vid["moved"]:
+                success_count += 1
+                log.info("[%d/%d] ✅ Pair complete → %s", i, len(self.pairs), st["base"])
+                log.info("  IMG: %s → %s", os.path.basename(img["src"]), os.path.basename(img["dst"]))
+                log.info("  MOV: %s → %s", os.path.basename(vid["src"]), os.path.basename(vid["dst"]))
+            else:
+                fail_count += 1
+                if not img["moved"]:
+                    log.error("  ❌ Image move FAILED for %s", img["src"])
+                if not vid["moved"]:
+                    log.error("  ❌ Video move FAILED for %s", vid["src"])
+        log.info("  Progress: %d copied, %d verified, %d finalized (of %d files)",
+                 counts["copied"], counts["verified"], counts["finalized"], len(files))
+        return success_count, fail_count
+
+
 def move_pairs(all_images: dict, all_videos: dict, dest_dir: Path,
-               dry_run: bool = False) -> dict:
+               dry_run: bool = False, mover: Optional[PairMover] = None) -> dict:
     """
     Match images to videos by UUID, move pairs to dest_dir.
+    Pairs already started on `mover` during the scan are not started again.
     Returns manifest dict.
     """
     dest_dir.mkdir(parents=True, exist_ok=True)
@@ -348,9 +980,14 @@ def move_pairs(all_images: dict, all_videos: dict, dest_dir: Path,
         "orphan_videos": [],
     }
 
-    matched_uuids = set(all_images.keys()) & set(all_videos.keys())
-    orphan_img_uuids = set(all_images.keys()) - matched_uuids
-    orphan_vid_uuids = set(all_videos.keys()) - matched_uuids
+    # Probe the larger index from the smaller one — no intermediate key sets
+    if len(all_images) <= len(all_videos):
+        smaller, larger = all_images, all_videos
+    else:
+        smaller, larger = all_videos, all_images
+    matched_uuids = [u for u in smaller if u in larger]
+    orphan_img_uuids = [u for u in all_images if u not in all_videos]
+    orphan_vid_uuids = [u for u in all_videos if u not in all_images]
 
     log.info("=" * 60)
     log.info("RESULTS: %d matched pairs | %d orphan images | %d orphan videos",
@@ -359,73 +996,38 @@ def move_pairs(all_images: dict, all_videos: dict, dest_dir: Path,
 
     if dry_run:
         for uuid in sorted(matched_uuids):
-            img_path, img_meta = all_images[uuid]
-            base = rich_base_name(img_meta, uuid)
-            vid_path, _ = all_videos[uuid]
-            img_ext = img_path.suffix.lower()
+            img = all_images[uuid]
+            base = rich_base_name(img, uuid)
+            img_path = img.path
+            vid_path = all_videos[uuid].path
+            img_ext = os.path.splitext(img_path)[1].lower()
             log.info("[DRY RUN PAIR] %s%s + %s", base, img_ext, ".mov")
             log.info("  IMG src: %s", img_path)
             log.info("  MOV src: %s", vid_path)
         for uuid in sorted(orphan_img_uuids):
-            p, _ = all_images[uuid]
+            p = all_images[uuid].path
             log.info("[DRY RUN ORPHAN IMG] %s [uuid=%s]", p, uuid[:8])
         for uuid in sorted(orphan_vid_uuids):
-            p, _ = all_videos[uuid]
+            p = all_videos[uuid].path
             log.info("[DRY RUN ORPHAN MOV] %s [uuid=%s]", p, uuid[:8])
         return manifest
 
-    success_count = 0
-    fail_count = 0
-
-    for i, uuid in enumerate(sorted(matched_uuids)):
-        if not _running:
-            log.warning("Move interrupted at pair %d/%d — stopping.", i, len(matched_uuids))
-            break
-
-        img_path, img_meta = all_images[uuid]
-        vid_path, _ = all_videos[uuid]
-
-        base = rich_base_name(img_meta, uuid)
-        img_ext = img_path.suffix.lower()
-
-        dest_img = safe_dest_path(dest_dir, base, img_ext)
-        dest_vid = safe_dest_path(dest_dir, base, ".mov")
-
-        log.info("[%d/%d] Moving pair → %s", i + 1, len(matched_uuids), base)
-        log.info("  IMG: %s → %s", img_path.name, dest_img.name)
-        log.info("  MOV: %s → %s", vid_path.name, dest_vid.name)
-
-        img_ok = safe_move(img_path, dest_img)
-        vid_ok = safe_move(vid_path, dest_vid)
-
-        entry = {
-            "uuid": uuid,
-            "base_name": base,
-            "image": {"source": str(img_path), "dest": str(dest_img), "success": img_ok},
-            "video": {"source": str(vid_path), "dest": str(dest_vid), "success": vid_ok},
-        }
-        manifest["pairs"].append(entry)
-
-        if img_ok and vid_ok:
-            success_count += 1
-            log.info("  ✅ Pair complete.")
-        else:
-            fail_count += 1
-            if not img_ok:
-                log.error("  ❌ Image move FAILED for %s", img_path)
-            if not vid_ok:
-                log.error("  ❌ Video move FAILED for %s", vid_path)
+    if mover is None:
+        mover = PairMover(dest_dir)
+    for uuid in sorted(matched_uuids):
+        mover.start(uuid, all_images[uuid], all_videos[uuid])
+    success_count, fail_count = mover.finish(manifest)
 
     # Log orphans
     for uuid in sorted(orphan_img_uuids):
-        p, _ = all_images[uuid]
+        p = all_images[uuid].path
         log.warning("[ORPHAN IMG] No matching MOV: %s [uuid=%s]", p, uuid[:8])
-        manifest["orphan_images"].append({"uuid": uuid, "path": str(p)})
+        manifest["orphan_images"].append({"uuid": uuid, "path": p})
 
     for uuid in sorted(orphan_vid_uuids):
-        p, _ = all_videos[uuid]
+        p = all_videos[uuid].path
         log.warning("[ORPHAN MOV] No matching image: %s [uuid=%s]", p, uuid[:8])
-        manifest["orphan_videos"].append({"uuid": uuid, "path": str(p)})
+        manifest["orphan_videos"].append({"uuid": uuid, "path": p})
 
     log.info("=" * 60)
     log.info("DONE: %d pairs moved OK | %d failed | %d orphan images | %d orphan videos",
@@ -434,11 +1036,32 @@ def move_pairs(all_images: dict, all_videos: dict, dest_dir: Path,
     return manifest
 
 
+def write_manifest(manifest: dict, path: Path) -> None:
+    """
+    Write the manifest as JSON with one pair / orphan record per line.
+    json's indent= mode falls back to the pure-Python encoder; encoding each
+    record compactly keeps the C encoder and the file still diffs and greps
+    line by line. Written as bytes in a single call.
+    """
+    encode = json.JSONEncoder().encode
+    lines = []
+    for i, (key, value) in enumerate(manifest.items()):
+        comma = "," if i < len(manifest) - 1 else ""
+        if isinstance(value, list) and value:
+            records = ",\n    ".join(map(encode, value))
+            lines.append(f"  {encode(key)}: [\n    {records}\n  ]{comma}")
+        else:
+            lines.append(f"  {encode(key)}: {encode(value)}{comma}")
+    with open(path, "wb") as f:
+        f.write(("{\n" + "\n".join(lines) + "\n}\n").encode())
+
+
 # ──────────────────────────────────────────────
 # Entry point
 # ──────────────────────────────────────────────
 
 def main():
+    global HASH_ALGO
     parser = argparse.ArgumentParser(
         description="LivePhotoSort v1.1.0 — detect and move Live Photo pairs"
     )
@@ -454,7 +1077,21 @@ def main():
         "--dest", default=DEST_DIR,
         help="Override destination directory"
     )
+    parser.add_argument(
+        "--strict-names", action="store_true",
+        help="Only scan camera-roll names (IMG_1234.HEIC/.JPG/.MOV); skips "
+             "screenshots and renamed files without running exiftool on them"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignore and rebuild the scan cache ({SCAN_CACHE_NAME} in the dest folder)"
+    )
+    parser.add_argument(
+        "--hash", choices=HASH_CHOICES, default=HASH_ALGO,
+        help="Digest used to verify each copy before deleting the source"
+    )
     args = parser.parse_args()
+    HASH_ALGO = args.hash
 
     # Write PID file for easy kill
     LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -465,40 +1102,57 @@ def main():
     log.info("Sources: %s", args.source)
     log.info("Dest:    %s", args.dest)
     log.info("DryRun:  %s", args.dry_run)
-    log.info("Batch size: %d files per exiftool call", EXIFTOOL_BATCH_SIZE)
+    log.info("Verify:  %s", HASH_ALGO)
+    log.info("Strict names: %s", args.strict_names)
+    log.info("Batch size: %d files per exiftool call (adaptive %d–%d), %d exiftool workers",
+             EXIFTOOL_BATCH_SIZE, EXIFTOOL_MIN_BATCH, EXIFTOOL_MAX_BATCH, EXIFTOOL_WORKERS)
     log.info("=" * 70)
 
     dest_dir = Path(args.dest)
     all_images: dict = {}
     all_videos: dict = {}
 
-    # Scan all sources — merge results (first-seen UUID wins)
+    # Files unchanged since the last run skip exiftool. --no-cache starts empty
+    # (the cache file is then rewritten from this run's scan).
+    cache = ScanCache(dest_dir / SCAN_CACHE_NAME, load=not args.no_cache)
+
+    # A pair starts copying as soon as both halves have been scanned, so
+    # copy I/O overlaps the rest of the scan. Whatever is left unmatched
+    # when the scan ends becomes an orphan in move_pairs.
+    mover = None if args.dry_run else PairMover(dest_dir)
+
+    def merge(kind: str, uuid: str, entry: LPEntry) -> None:
+        index, other = (all_images, all_videos) if kind == "image" else (all_videos, all_images)
+        if uuid in index:
+            return  # first-seen UUID wins across sources
+        index[uuid] = entry
+        if mover is not None and uuid in other:
+            mover.start(uuid, all_images[uuid], all_videos[uuid])
+
+    # Scan all sources — merge results as they stream in
     for src in args.source:
-        imgs, vids = scan_folder(src)
-        new_imgs = 0
-        new_vids = 0
-        for uuid, val in imgs.items():
-            if uuid not in all_images:
-                all_images[uuid] = val
-                new_imgs += 1
-        for uuid, val in vids.items():
-            if uuid not in all_videos:
-                all_videos[uuid] = val
-                new_vids += 1
+        n_imgs, n_vids = len(all_images), len(all_videos)
+        scan_folder(src, strict_names=args.strict_names, cache=cache, on_entry=merge)
         log.info("After merging %s: +%d images, +%d videos (totals: %d images, %d videos)",
-                 src, new_imgs, new_vids, len(all_images), len(all_videos))
+                 src, len(all_images) - n_imgs, len(all_videos) - n_vids,
+                 len(all_images), len(all_videos))
+
+    try:
+        cache.save()
+    except OSError as exc:
+        log.error("Could not write scan cache: %s", exc)
 
     log.info("Grand total: %d unique LP images, %d unique LP companion videos",
              len(all_images), len(all_videos))
 
-    manifest = move_pairs(all_images, all_videos, dest_dir, dry_run=args.dry_run)
+    manifest = move_pairs(all_images, all_videos, dest_dir,
+                          dry_run=args.dry_run, mover=mover)
 
     if not args.dry_run:
         # Write manifest JSON
         manifest_path = dest_dir / "live_photo_manifest.json"
         try:
-            with open(manifest_path, "w") as f:
-                json.dump(manifest, f, indent=2)
+            write_manifest(manifest, manifest_path)
             log.info("Manifest written to %s", manifest_path)
         except Exception as exc:
             log.error("Could not write manifest: %s", exc)